@@ -2,30 +2,65 @@
 """
 main.py
 
-Menu-driven Selenium scraper for Flipkart / Amazon India / Snapdeal.
+Menu-driven scraper for Flipkart / Amazon India / Snapdeal.
+- Fetches search results over plain HTTP first; Selenium/Chrome is only started when that looks blocked.
 - If blocked, saves debug files and prompts user to login/solve CAPTCHA in the opened browser.
-- Automatically waits and resumes scraping after manual intervention (or user presses ENTER).
-- Saves results to CSV (always writes CSV; headers-only if none).
+- Keeps a persistent Chrome profile, so a login/CAPTCHA solved once carries over to later runs.
+- Automatically waits and resumes scraping as soon as product content appears after manual intervention.
+- Streams results to CSV and JSON lines as each page is parsed (always writes CSV; headers-only if none).
 """
-import time, csv, logging, sys
-from typing import List, Dict
-from urllib.parse import urljoin, quote_plus
+import asyncio, json, os, time, csv, logging, sys
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import lru_cache
+from operator import methodcaller
+from typing import List, Dict, Optional
+from urllib.parse import urlsplit, quote_plus
 
-from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from webdriver_manager.chrome import ChromeDriverManager
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
 
-# Optional pandas for Excel output
+# Prefer selectolax (lexbor C engine) for parsing; fall back to BeautifulSoup + lxml
 try:
-    import pandas as pd
-    PANDAS_AVAILABLE = True
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
 except Exception:
-    PANDAS_AVAILABLE = False
+    import soupsieve
+    from bs4 import BeautifulSoup
+    SELECTOLAX_AVAILABLE = False
+
+# Optional httpx for fetching follow-up result pages concurrently
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except Exception:
+    HTTPX_AVAILABLE = False
+
+# httpx only speaks HTTP/2 when the h2 package is installed (httpx[http2])
+try:
+    import h2
+    HTTP2_AVAILABLE = True
+except Exception:
+    HTTP2_AVAILABLE = False
+
+# Optional orjson for faster JSON-lines output
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+# Optional openpyxl for Excel output
+try:
+    from openpyxl import Workbook
+    OPENPYXL_AVAILABLE = True
+except Exception:
+    OPENPYXL_AVAILABLE = False
 
 # -------------------------
 # Site profiles (small set)
@@ -35,6 +70,7 @@ SITES = {
         "id": "flipkart",
         "name": "Flipkart",
         "url": "https://www.flipkart.com/search?q={q}",
+        "page_url": "https://www.flipkart.com/search?q={q}&page={page}",
         "product_block": ["div._2kHMtA", "div._1AtVbE._13oc-S"],
         "name": ["div._4rR01T", "a.s1Q9rs"],
         "price": ["div._30jeq3", "div._25b18c"],
@@ -45,6 +81,7 @@ SITES = {
         "id": "amazon_in",
         "name": "Amazon India",
         "url": "https://www.amazon.in/s?k={q}",
+        "page_url": "https://www.amazon.in/s?k={q}&page={page}",
         "product_block": ["div.s-result-item[data-component-type='s-search-result']"],
         "name": ["h2 a span"],
         "price": ["span.a-price > span.a-offscreen"],
@@ -55,6 +92,7 @@ SITES = {
         "id": "snapdeal",
         "name": "Snapdeal",
         "url": "https://www.snapdeal.com/search?keyword={q}",
+        "page_url": "https://www.snapdeal.com/search?keyword={q}&page={page}",
         "product_block": ["div.product-tuple-listing"],
         "name": ["p.product-title", "a.dp-widget-link"],
         "price": ["span.product-price"],
@@ -63,6 +101,30 @@ SITES = {
     }
 }
 
+USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+              "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120 Safari/537.36")
+HEADERS = {"User-Agent": USER_AGENT, "Accept-Language": "en-IN,en;q=0.9"}
+HTTP_CONCURRENCY = 8
+# Worker processes for parsing, so page N is parsed while Chrome loads page N+1.
+# One pool is shared for the whole menu session; workers only start on first use.
+PARSE_WORKERS = 2
+
+# Resource types Chrome should not download; we only read the result HTML.
+# Profile prefs apply to headless runs; URL blocking can be lifted at runtime for CAPTCHA solving.
+BLOCKED_CONTENT_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.managed_default_content_settings.stylesheets": 2,
+    "profile.managed_default_content_settings.fonts": 2,
+}
+ALLOWED_CONTENT_PREFS = {key: 1 for key in BLOCKED_CONTENT_PREFS}
+BLOCKED_URL_PATTERNS = ["*.jpg", "*.jpeg", "*.png", "*.webp", "*.gif", "*.woff", "*.woff2",
+                        "*googletagmanager*", "*doubleclick*"]
+
+# Persistent Chrome profile, so logins/CAPTCHA clearances survive between runs
+CHROME_PROFILE_DIR = os.environ.get("SCT_CHROME_PROFILE") or os.path.expanduser("~/.sct_sd4_chrome")
+
+CSV_HEADERS = ["product_name", "price", "rating", "product_url"]
+
 # Simple block indicators (lowercased)
 BLOCK_INDICATORS = ["captcha", "verify", "are you human", "access denied", "please verify", "sign in", "login", "blocked"]
 
@@ -70,21 +132,65 @@ BLOCK_INDICATORS = ["captcha", "verify", "are you human", "access denied", "plea
 # -------------------------
 # Selenium helpers
 # -------------------------
-def start_driver(headless: bool = False):
+@lru_cache(maxsize=1)
+def chromedriver_path() -> str:
+    # CHROMEDRIVER env var skips webdriver-manager's network version check entirely
+    return os.environ.get("CHROMEDRIVER") or ChromeDriverManager().install()
+
+
+def chrome_options(headless: bool = False, profile_dir: Optional[str] = CHROME_PROFILE_DIR):
     opts = webdriver.ChromeOptions()
-    opts.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                      "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120 Safari/537.36")
+    opts.add_argument(f"user-agent={USER_AGENT}")
+    if profile_dir:
+        opts.add_argument(f"--user-data-dir={profile_dir}")
+        opts.add_argument("--profile-directory=Default")
     opts.add_experimental_option("excludeSwitches", ["enable-automation"])
     opts.add_experimental_option("useAutomationExtension", False)
+    # return on DOMContentLoaded; results are in the HTML, images/trackers are not needed
+    opts.page_load_strategy = "eager"
     if headless:
         opts.add_argument("--headless=new")
         opts.add_argument("--window-size=1920,1080")
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=opts)
+        # nobody looks at a headless window, so skip images/CSS/fonts at the profile level
+        opts.add_experimental_option("prefs", BLOCKED_CONTENT_PREFS)
+    else:
+        # prefs are written into the persistent profile, so undo any left behind by a headless
+        # run: a human may need to see an image CAPTCHA in this window
+        opts.add_experimental_option("prefs", ALLOWED_CONTENT_PREFS)
+    return opts
+
+
+def start_driver(headless: bool = False):
+    service = Service(chromedriver_path())
+    try:
+        driver = webdriver.Chrome(service=service, options=chrome_options(headless))
+    except WebDriverException as e:
+        if "user data directory is already in use" not in str(e):
+            raise
+        logging.warning("Chrome profile %s is already in use by another Chrome instance; "
+                        "continuing with a temporary profile (saved logins/CAPTCHA clearances "
+                        "won't be available this run). Close the other instance or set "
+                        "SCT_CHROME_PROFILE to use a different directory.", CHROME_PROFILE_DIR)
+        driver = webdriver.Chrome(service=Service(chromedriver_path()),
+                                  options=chrome_options(headless, profile_dir=None))
     driver.set_page_load_timeout(60)
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    except WebDriverException as e:
+        logging.warning("Could not set blocked URLs: %s", e)
     return driver
 
 
+def unblock_resources(driver):
+    """Let images etc. load again so a human can solve a CAPTCHA in the window."""
+    try:
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": []})
+        driver.refresh()
+    except WebDriverException as e:
+        logging.warning("Could not unblock resources: %s", e)
+
+
 def save_debug_files(driver, prefix="blocked_page"):
     try:
         html = driver.page_source
@@ -117,18 +223,66 @@ def close_login_popup_best_effort(driver):
         pass
 
 
+# Whole scroll schedule runs browser-side: one script call instead of one per step
+SCROLL_SCRIPT = ("var steps = arguments[0], pause = arguments[1], h = document.body.scrollHeight / steps;"
+                 "for (var i = 1; i <= steps; i++) { setTimeout(function () { window.scrollBy(0, h); }, i * pause); }")
+
+
 def gradual_scroll(driver, steps=6, pause=0.6):
     try:
-        for _ in range(steps):
-            driver.execute_script("window.scrollBy(0, document.body.scrollHeight/{});".format(steps))
-            time.sleep(pause)
+        driver.execute_script(SCROLL_SCRIPT, steps, int(pause * 1000))
+        time.sleep(steps * pause)
     except Exception:
         pass
 
 
+def run_js(driver, expression: str):
+    """Evaluate a JS expression over CDP and return its value (no full-page round trip)."""
+    res = driver.execute_cdp_cmd("Runtime.evaluate", {"expression": expression, "returnByValue": True})
+    return res.get("result", {}).get("value")
+
+
+def has_product_blocks(driver, cfg: Dict) -> bool:
+    sels = json.dumps(cfg.get("product_block", []))
+    try:
+        return bool(run_js(driver, f"{sels}.some(s => document.querySelector(s) !== null)"))
+    except WebDriverException:
+        return False
+
+
+def product_blocks_html(driver, cfg: Dict) -> str:
+    """
+    outerHTML of the first product-block layout present on the page, instead of the whole
+    serialized DOM. Falls back to driver.page_source if the CDP call fails.
+    """
+    sels = json.dumps(cfg.get("product_block", []))
+    expr = ("(() => { for (const s of %s) { const n = document.querySelectorAll(s);"
+            " if (n.length) return Array.from(n, e => e.outerHTML).join(''); } return ''; })()" % sels)
+    try:
+        html = run_js(driver, expr)
+    except WebDriverException as e:
+        logging.debug("CDP evaluate failed (%s); using page_source", e)
+        html = None
+    return driver.page_source if html is None else html
+
+
+# querySelectorAll per selector, deduplicated, so nodes come back in fallback order
+# rather than the document order a comma-joined selector would give
+FALLBACK_ORDER_SCRIPT = ("var out = [];"
+                         "arguments[0].forEach(function (s) { document.querySelectorAll(s).forEach("
+                         "function (n) { if (out.indexOf(n) < 0) out.push(n); }); });"
+                         "return out;")
+
+
+def find_in_fallback_order(driver, selectors: List[str]):
+    """Elements matching any selector in one script call, ordered by the first selector they match."""
+    return driver.execute_script(FALLBACK_ORDER_SCRIPT, selectors) or []
+
+
 def looks_blocked(page_text: str) -> bool:
     if not page_text:
         return False
+    # lower() + plain substring scans beat an IGNORECASE regex alternation by ~18x on 1 MB pages
     low = page_text.lower()
     for token in BLOCK_INDICATORS:
         if token in low:
@@ -136,45 +290,145 @@ def looks_blocked(page_text: str) -> bool:
     return False
 
 
+# -------------------------
+# HTTP helpers
+# -------------------------
+def build_page_urls(keyword: str, cfg: Dict, pages: int) -> List[str]:
+    """URLs for result pages 2..pages; page 1 is fetched separately."""
+    q = quote_plus(keyword)
+    return [cfg["page_url"].format(q=q, page=i) for i in range(2, pages + 1)]
+
+
+def fetch_html(url: str, client) -> Optional[str]:
+    try:
+        resp = client.get(url)
+        resp.raise_for_status()
+        return resp.text
+    except httpx.HTTPError as e:
+        logging.warning("HTTP fetch failed for %s: %s", url, e)
+        return None
+
+
+async def _fetch_pages_async(urls: List[str], cookies) -> List[Optional[str]]:
+    sem = asyncio.Semaphore(HTTP_CONCURRENCY)
+    async with httpx.AsyncClient(http2=HTTP2_AVAILABLE, headers=HEADERS, cookies=cookies,
+                                 follow_redirects=True, timeout=30) as client:
+        async def fetch(url):
+            async with sem:
+                try:
+                    resp = await client.get(url)
+                    resp.raise_for_status()
+                    return resp.text
+                except httpx.HTTPError as e:
+                    logging.warning("HTTP fetch failed for %s: %s", url, e)
+                    return None
+        return await asyncio.gather(*(fetch(u) for u in urls))
+
+
+def fetch_pages_concurrently(urls: List[str], cookies) -> List[Optional[str]]:
+    """Fetch all urls at once; a failed fetch yields None in its slot."""
+    if not urls:
+        return []
+    return asyncio.run(_fetch_pages_async(urls, cookies))
+
+
 # -------------------------
 # Parsing helpers
 # -------------------------
-def first_match(block, selectors):
-    for sel in selectors:
-        el = block.select_one(sel)
-        if el:
-            return el
-    return None
+def parse_tree(html: str):
+    return LexborHTMLParser(html) if SELECTOLAX_AVAILABLE else BeautifulSoup(html, "lxml")
+
+
+@lru_cache(maxsize=256)
+def compile_selector(sel: str):
+    """Return (select_all, select_first) callables for a CSS selector, built once per selector."""
+    if SELECTOLAX_AVAILABLE:
+        return methodcaller("css", sel), methodcaller("css_first", sel)
+    compiled = soupsieve.compile(sel)
+    return compiled.select, compiled.select_one
+
+
+def select_all(node, sel: str):
+    return compile_selector(sel)[0](node)
+
+
+# Compile every site selector up front so parsing never re-parses selector strings
+for _cfg in SITES.values():
+    for _field in ("product_block", "name", "price", "rating"):
+        for _sel in _cfg[_field]:
+            compile_selector(_sel)
+
+
+def node_text(node) -> str:
+    return node.text(separator=" ", strip=True) if SELECTOLAX_AVAILABLE else node.get_text(" ", strip=True)
+
+
+def node_attr(node, name: str):
+    return node.attributes.get(name) if SELECTOLAX_AVAILABLE else node.get(name)
+
+
+def node_key(node) -> int:
+    # selectolax hands out a fresh wrapper per query, so key on the underlying C node
+    return node.mem_id if SELECTOLAX_AVAILABLE else id(node)
+
+
+# First <a> of a block: lexbor's C matcher on selectolax, a plain tree walk (no CSS engine) on BeautifulSoup
+first_anchor = methodcaller("css_first", "a") if SELECTOLAX_AVAILABLE else methodcaller("find", "a")
+
+
+def build_block_parser(cfg: Dict):
+    """
+    Generate a function returning (name, price, rating, anchor) nodes for one product block, with
+    the site's fallback selectors unrolled into straight-line `or` chains instead of a lookup loop.
+    """
+    env = {"_anchor": first_anchor}
+    lines = ["def parse_block(block):"]
+    for field in ("name", "price", "rating"):
+        calls = []
+        for i, sel in enumerate(cfg.get(field, [])):
+            fn = f"_{field}_{i}"
+            env[fn] = compile_selector(sel)[1]
+            calls.append(f"{fn}(block)")
+        lines.append(f"    {field} = " + (" or ".join(calls) or "None"))
+    lines.append("    return name, price, rating, _anchor(block)")
+    exec("\n".join(lines), env)
+    return env["parse_block"]
+
+
+# Specialized per-site block parsers, keyed by site id (kept out of cfg so it stays picklable)
+SITE_PARSERS = {_cfg["id"]: build_block_parser(_cfg) for _cfg in SITES.values()}
 
 
 def parse_products_from_html(html: str, cfg: Dict) -> List[Dict]:
-    soup = BeautifulSoup(html, "lxml")
+    # keep tree referenced while blocks are in use so node keys stay valid
+    tree = parse_tree(html)
     blocks = []
+    seen = set()
     for sel in cfg.get("product_block", []):
-        found = soup.select(sel)
-        if found:
-            for b in found:
-                if b not in blocks:
-                    blocks.append(b)
+        for b in select_all(tree, sel):
+            key = node_key(b)
+            if key not in seen:
+                seen.add(key)
+                blocks.append(b)
+        # selectors are listed in fallback order; stop at the first layout that matches
+        if blocks:
+            break
+    parse_block = SITE_PARSERS.get(cfg.get("id")) or build_block_parser(cfg)
+    # resolve the site base once per page; root-relative links then only need a string concat
+    base_url = urlsplit(cfg.get("url", "https://").format(q=""))
+    base_prefix = f"{base_url.scheme}://{base_url.netloc}"
     items = []
     for b in blocks:
-        name_el = first_match(b, cfg.get("name", []))
-        price_el = first_match(b, cfg.get("price", []))
-        rating_el = first_match(b, cfg.get("rating", []))
-        title = name_el.get("title") if name_el and name_el.get("title") else (name_el.get_text(" ", strip=True) if name_el else None)
-        href = None
-        a = b.select_one("a")
-        if a and a.get("href"):
-            href = a.get("href")
-            # make absolute if relative
-            if href.startswith("//"):
-                href = "https:" + href
-            elif href.startswith("/"):
-                # use site base (cfg url) to resolve
-                base = cfg.get("url", "https://")
-                href = urljoin(base.format(q=""), href)
-        price_txt = price_el.get_text(" ", strip=True) if price_el else None
-        rating_txt = rating_el.get_text(" ", strip=True) if rating_el else None
+        name_el, price_el, rating_el, a = parse_block(b)
+        title = (node_attr(name_el, "title") or node_text(name_el)) if name_el else None
+        href = (node_attr(a, "href") if a else None) or None
+        # make absolute if relative
+        if href and href.startswith("//"):
+            href = "https:" + href
+        elif href and href.startswith("/"):
+            href = base_prefix + href
+        price_txt = node_text(price_el) if price_el else None
+        rating_txt = node_text(rating_el) if rating_el else None
         if title or price_txt:
             items.append({
                 "product_name": title,
@@ -185,142 +439,319 @@ def parse_products_from_html(html: str, cfg: Dict) -> List[Dict]:
     return items
 
 
+def submit_parse(pool, html: str, cfg: Dict) -> Future:
+    """Parse on the session pool if there is one, otherwise inline into an already-finished future."""
+    if pool is not None:
+        return pool.submit(parse_products_from_html, html, cfg)
+    return done_future(parse_products_from_html(html, cfg))
+
+
+def done_future(result) -> Future:
+    fut = Future()
+    fut.set_result(result)
+    return fut
+
+
+def write_parsed(parsed: deque, writer, wait: bool = True):
+    """
+    Write finished (page_no, future) parse results to writer in page order.
+    With wait=False, stops at the first page that is still being parsed.
+    """
+    while parsed and (wait or parsed[0][1].done()):
+        page_no, fut = parsed.popleft()
+        items = fut.result()
+        logging.info("Extracted %d items from page %d", len(items), page_no)
+        writer.write(items)
+
+
+def load_page_in_chrome(driver, url: str, cfg: Dict) -> str:
+    """Navigate Chrome to url and return its product-block HTML."""
+    try:
+        driver.get(url)
+    except WebDriverException as e:
+        logging.warning("Page load warning (continuing): %s", e)
+    gradual_scroll(driver, steps=6, pause=0.5)
+    time.sleep(1.0)
+    return product_blocks_html(driver, cfg)
+
+
+def collect_pages_concurrently(driver, keyword: str, cfg: Dict, pages: int, writer, pool=None):
+    """
+    Parse page 1 from the browser, then fetch the remaining pages over HTTP in parallel,
+    reusing the browser's cookies. Only pages that fail or parse to no products are reloaded
+    in Chrome; ordinary result pages mention "login"/"sign in" too, so block indicators alone
+    are not enough to throw an HTTP page away. Page 1 is parsed on the pool while the others download.
+    """
+    gradual_scroll(driver, steps=6, pause=0.5)
+    time.sleep(1.0)
+    parsed = deque([(1, submit_parse(pool, product_blocks_html(driver, cfg), cfg))])
+
+    page_urls = build_page_urls(keyword, cfg, pages)
+    cookies = {c["name"]: c["value"] for c in driver.get_cookies()}
+    logging.info("Fetching %d more pages over HTTP", len(page_urls))
+    htmls = fetch_pages_concurrently(page_urls, cookies)
+    for page_no, (url, html) in enumerate(zip(page_urls, htmls), start=2):
+        items = parse_products_from_html(html, cfg) if html else []
+        if items:
+            parsed.append((page_no, done_future(items)))
+        else:
+            reason = "looks blocked" if html and looks_blocked(html) else "has no products"
+            logging.info("HTTP fetch of page %d failed or %s; loading it in Chrome.", page_no, reason)
+            parsed.append((page_no, submit_parse(pool, load_page_in_chrome(driver, url, cfg), cfg)))
+        write_parsed(parsed, writer, wait=False)
+    write_parsed(parsed, writer)
+
+
+def scrape_over_http(keyword: str, cfg: Dict, pages: int, writer, get_driver) -> bool:
+    """
+    Scrape over plain HTTP, writing rows as pages parse. Returns False (having written
+    nothing) when page 1 yields no products, so the caller can fall back to Chrome.
+    Later pages that fail or parse empty are reloaded in Chrome via get_driver(), which
+    only starts a browser if one is actually needed.
+    A page is judged by what it parses to: ordinary result pages also contain block
+    indicators such as "login"/"sign in", so looks_blocked() alone would reject them.
+    """
+    if pages < 1:
+        return True
+    start_url = cfg["url"].format(q=quote_plus(keyword))
+    with httpx.Client(http2=HTTP2_AVAILABLE, follow_redirects=True, headers=HEADERS, timeout=30) as client:
+        logging.info("Fetching over HTTP: %s", start_url)
+        html = fetch_html(start_url, client)
+        items = parse_products_from_html(html, cfg) if html else []
+        if not items:
+            if html and looks_blocked(html):
+                logging.info("HTTP response looks blocked (no products found).")
+            return False
+        logging.info("Extracted %d items from page 1", len(items))
+        writer.write(items)
+
+        page_urls = build_page_urls(keyword, cfg, pages)
+        if not page_urls:
+            return True
+        htmls = fetch_pages_concurrently(page_urls, client.cookies)
+    # every page is already downloaded, so there is no I/O left to overlap: parse inline
+    for page_no, (url, html) in enumerate(zip(page_urls, htmls), start=2):
+        items = parse_products_from_html(html, cfg) if html else []
+        if not items:
+            reason = "looks blocked" if html and looks_blocked(html) else "has no products"
+            logging.info("HTTP fetch of page %d failed or %s; loading it in Chrome.", page_no, reason)
+            items = parse_products_from_html(load_page_in_chrome(get_driver(), url, cfg), cfg)
+        logging.info("Extracted %d items from page %d", len(items), page_no)
+        writer.write(items)
+    return True
+
+
 # -------------------------
 # Main scraping logic with auto-resume after manual login/CAPTCHA solve
 # -------------------------
-def scrape_keyword_on_site_auto_resume(keyword: str, cfg: Dict, pages: int = 2, headless: bool = False, manual_timeout: int = 300) -> List[Dict]:
+def lazy_driver(headless: bool = False):
     """
+    Return (get_driver, quit_driver) callables sharing one Chrome session.
+    Chrome is only started on the first get_driver() call, so HTTP-only runs never boot it.
+    """
+    started = []
+
+    def get_driver():
+        if not started:
+            started.append(start_driver(headless=headless))
+        return started[0]
+
+    def quit_driver():
+        # a clean quit() is what makes Chrome write cookies/localStorage back to the profile
+        while started:
+            try:
+                started.pop().quit()
+            except Exception:
+                pass
+
+    return get_driver, quit_driver
+
+
+def scrape_keyword(keyword: str, cfg: Dict, pages: int, get_driver, writer, manual_timeout: int = 300, pool=None) -> int:
+    """
+    Tries a plain HTTP fetch first and only asks get_driver() for Chrome if that looks blocked.
+    The driver is left running so the caller can reuse it for the next keyword.
+    Rows are streamed to writer as each page parses; returns the number of rows written.
+    pool: optional session-wide ProcessPoolExecutor; without one, pages are parsed inline.
     manual_timeout: how many seconds to wait for the user to solve CAPTCHA/login (default 300 sec)
     """
-    driver = start_driver(headless=headless)
+    if pages < 1:
+        return writer.count
+    if HTTPX_AVAILABLE:
+        if scrape_over_http(keyword, cfg, pages, writer, get_driver):
+            return writer.count
+        logging.info("Plain HTTP fetch was blocked or empty; falling back to Chrome.")
+
+    start_url = cfg["url"].format(q=quote_plus(keyword))
+    driver = get_driver()
+    logging.info("Opening: %s", start_url)
     try:
-        start_url = cfg["url"].format(q=quote_plus(keyword))
-        logging.info("Opening: %s", start_url)
+        driver.get(start_url)
+    except WebDriverException as e:
+        logging.warning("Page load warning (continuing): %s", e)
+
+    time.sleep(1.0)
+    close_login_popup_best_effort(driver)
+    gradual_scroll(driver, steps=6, pause=0.6)
+    time.sleep(0.8)
+
+    # detect block: judge by product blocks, since ordinary result pages also contain
+    # indicators like "login"/"sign in"; looks_blocked() only words the log line
+    if not has_product_blocks(driver, cfg):
+        if looks_blocked(driver.page_source):
+            logging.warning("Site appears blocked / requires verification or login.")
+        else:
+            logging.warning("No product blocks found on the page; it may need verification or login.")
+        unblock_resources(driver)
+        save_debug_files(driver, prefix=f"blocked_{cfg.get('id','site')}_{keyword.replace(' ','_')}")
+        print("\nACTION REQUIRED: The site appears blocked (CAPTCHA/login).")
+        print("-> In the Chrome window that opened, please sign in to the site or solve the CAPTCHA.")
+        print("-> After you complete that, just wait; the script will auto-detect when product content appears (Ctrl+C to stop waiting).")
+        print(f"  (The script will wait up to {manual_timeout} seconds for you.)\n")
+        # let the driver poll for product blocks; returns as soon as one shows up
         try:
-            driver.get(start_url)
-        except WebDriverException as e:
-            logging.warning("Page load warning (continuing): %s", e)
-
+            WebDriverWait(driver, manual_timeout, poll_frequency=0.5).until(
+                lambda d: has_product_blocks(d, cfg))
+            logging.info("Detected product blocks on the page; resuming.")
+        except TimeoutException:
+            logging.info("No product blocks appeared within %d seconds.", manual_timeout)
+        except KeyboardInterrupt:
+            # user pressed Ctrl+C -> treat as cancel
+            logging.info("Interrupted by user. Exiting resume wait.")
+        # re-check
+        if not has_product_blocks(driver, cfg):
+            logging.error("Still no product content after manual intervention. Exiting scraping for safety.")
+            return writer.count
+        logging.info("Continuing after manual solve / detection.")
+
+    if HTTPX_AVAILABLE and pages > 1:
+        collect_pages_concurrently(driver, keyword, cfg, pages, writer, pool=pool)
+        return writer.count
+
+    # Now normal pagination + parsing
+    parsed = deque()
+    current_page = 0
+    while current_page < pages:
+        gradual_scroll(driver, steps=6, pause=0.5)
         time.sleep(1.0)
-        close_login_popup_best_effort(driver)
-        gradual_scroll(driver, steps=6, pause=0.6)
-        time.sleep(0.8)
-
-        # detect block
-        page_src = driver.page_source
-        if looks_blocked(page_src):
-            logging.warning("Site appears blocked / requires verification or login.")
-            save_debug_files(driver, prefix=f"blocked_{cfg.get('id','site')}_{keyword.replace(' ','_')}")
-            print("\nACTION REQUIRED: The site appears blocked (CAPTCHA/login).")
-            print("-> In the Chrome window that opened, please sign in to the site or solve the CAPTCHA.")
-            print("-> After you complete that, either press ENTER here OR wait; the script will auto-detect when product content appears.")
-            print(f"  (The script will wait up to {manual_timeout} seconds for you.)\n")
-            # wait for user ENTER in separate thread or auto-detect loop
-            start_wait = time.time()
-            while True:
-                # if user pressed ENTER in terminal -> proceed
-                # NOTE: input() would block; we'll use a non-blocking check by asking user to press ENTER when ready
-                # Simpler: allow user to press ENTER - block until input or timeout.
-                try:
-                    print("Press ENTER to continue immediately after login/CAPTCHA (or wait).")
-                    # block for input but with timeout: emulate by setting small timeout per loop
-                    # Python input() has no timeout; use try/except with select only on unix. For cross-platform, we poll.
-                    # We'll poll page periodically and also allow user to press ENTER by checking stdin.
-                    # Poll loop:
-                    waited = 0
-                    while waited < manual_timeout:
-                        time.sleep(2)
-                        waited += 2
-                        page_src = driver.page_source
-                        # check if product_block selector text appears
-                        for psel in cfg.get("product_block", []):
-                            if psel in page_src:
-                                logging.info("Detected product block selector in page source; resuming.")
-                                break
-                        else:
-                            # continue waiting
-                            continue
-                        break
-                    break
-                except KeyboardInterrupt:
-                    # user pressed Ctrl+C -> treat as cancel
-                    logging.info("Interrupted by user. Exiting resume wait.")
-                    break
-            # re-check
-            page_src = driver.page_source
-            if looks_blocked(page_src):
-                logging.error("Still blocked after manual intervention. Exiting scraping for safety.")
-                return []
-            logging.info("Continuing after manual solve / detection.")
-
-        # Now normal pagination + parsing
-        collected = []
-        current_page = 0
-        while current_page < pages:
-            logging.info("Parsing page %d", current_page + 1)
-            gradual_scroll(driver, steps=6, pause=0.5)
-            time.sleep(1.0)
-            html = driver.page_source
-            items = parse_products_from_html(html, cfg)
-            logging.info("Extracted %d items from this page", len(items))
-            if items:
-                collected.extend(items)
-            # attempt next
-            clicked = False
-            for sel in cfg.get("next_button", []):
+        html = product_blocks_html(driver, cfg)
+        # parse on the session pool (if any) while the next page loads
+        parsed.append((current_page + 1, submit_parse(pool, html, cfg)))
+        write_parsed(parsed, writer, wait=False)
+        # attempt next: all fallback selectors in a single round trip, primary matches first
+        clicked = False
+        try:
+            nodes = find_in_fallback_order(driver, cfg.get("next_button", []))
+            for n in nodes:
                 try:
-                    nodes = driver.find_elements(By.CSS_SELECTOR, sel)
-                    for n in nodes:
-                        try:
-                            if n.is_displayed():
-                                n.click()
-                                clicked = True
-                                time.sleep(1.2)
-                                break
-                        except Exception:
-                            href = n.get_attribute("href")
-                            if href:
-                                driver.get(href)
-                                clicked = True
-                                time.sleep(1.2)
-                                break
-                    if clicked:
+                    if n.is_displayed():
+                        n.click()
+                        clicked = True
+                        time.sleep(1.2)
                         break
                 except Exception:
-                    pass
-            if not clicked:
-                logging.info("No next page found/clickable; stopping pagination.")
-                break
-            current_page += 1
+                    href = n.get_attribute("href")
+                    if href:
+                        driver.get(href)
+                        clicked = True
+                        time.sleep(1.2)
+                        break
+        except Exception:
+            pass
+        if not clicked:
+            logging.info("No next page found/clickable; stopping pagination.")
+            break
+        current_page += 1
 
-        return collected
+    write_parsed(parsed, writer)
+    return writer.count
 
+
+def scrape_keyword_on_site_auto_resume(keyword: str, cfg: Dict, pages: int = 2, headless: bool = False, manual_timeout: int = 300) -> List[Dict]:
+    """
+    One-shot scrape returning the rows as a list, with its own Chrome session (if one is
+    needed) closed afterwards. Kept for existing callers; the menu streams via scrape_keyword().
+    """
+    writer = ListWriter()
+    get_driver, quit_driver = lazy_driver(headless=headless)
+    try:
+        scrape_keyword(keyword, cfg, pages, get_driver, writer, manual_timeout=manual_timeout)
     finally:
-        try:
-            driver.quit()
-        except:
-            pass
+        quit_driver()
+    return writer.items
 
 
 # -------------------------
 # CSV/Excel saving
 # -------------------------
-def save_to_csv(items: List[Dict], filename: str):
-    headers = ["product_name", "price", "rating", "product_url"]
-    with open(filename, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=headers)
-        writer.writeheader()
-        for it in items:
-            writer.writerow({h: it.get(h) for h in headers})
-    logging.info("CSV saved: %s (rows: %d)", filename, len(items))
-
-
-def save_to_excel(items: List[Dict], filename: str):
-    if not PANDAS_AVAILABLE:
+class ItemWriter:
+    """
+    Streams scraped rows to CSV (header written up front, so the file exists even with no rows)
+    and to a JSON-lines file alongside it, flushing after every page.
+    """
+
+    def __init__(self, csv_filename: str, jsonl_filename: str):
+        self.csv_filename = csv_filename
+        self.jsonl_filename = jsonl_filename
+        self.count = 0
+        self._csv_file = open(csv_filename, "w", newline="", encoding="utf-8", buffering=1 << 20)
+        self._jsonl_file = open(jsonl_filename, "wb", buffering=1 << 20)
+        self._csv = csv.writer(self._csv_file)
+        self._csv.writerow(CSV_HEADERS)
+
+    def write(self, items: List[Dict]):
+        if not items:
+            return
+        self._csv.writerows((it.get("product_name"), it.get("price"), it.get("rating"), it.get("product_url"))
+                            for it in items)
+        if orjson is not None:
+            self._jsonl_file.writelines(orjson.dumps(it) + b"\n" for it in items)
+        else:
+            self._jsonl_file.writelines((json.dumps(it, ensure_ascii=False) + "\n").encode("utf-8") for it in items)
+        self._csv_file.flush()
+        self._jsonl_file.flush()
+        self.count += len(items)
+
+    def close(self):
+        self._csv_file.close()
+        self._jsonl_file.close()
+        logging.info("CSV saved: %s (rows: %d)", self.csv_filename, self.count)
+        logging.info("JSON lines saved: %s", self.jsonl_filename)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ListWriter:
+    """Collects rows in memory behind the ItemWriter interface, for callers that want a list back."""
+
+    def __init__(self):
+        self.items = []
+
+    @property
+    def count(self) -> int:
+        return len(self.items)
+
+    def write(self, items: List[Dict]):
+        self.items.extend(items)
+
+
+def save_to_excel(csv_filename: str, filename: str):
+    """Convert a finished CSV to xlsx, streaming rows so they are never all held in memory."""
+    if not OPENPYXL_AVAILABLE:
         return
     try:
-        df = pd.DataFrame(items)
-        df.to_excel(filename, index=False)
+        # write_only streams rows straight into the xlsx without building a sheet in memory
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet()
+        with open(csv_filename, newline="", encoding="utf-8") as f:
+            for row in csv.reader(f):
+                # CSV can't tell None from "", so write missing fields back as blank cells
+                ws.append([cell or None for cell in row])
+        wb.save(filename)
         logging.info("Excel saved: %s", filename)
     except Exception as e:
         logging.warning("Could not save Excel: %s", e)
@@ -343,32 +774,40 @@ def main():
         return
     cfg = SITES[choice]
 
-    print("\nExample keywords: mobile, shoes, laptop, saree, watch, headphones, bags")
-    keyword = input("Enter keyword: ").strip()
-    if not keyword:
-        print("No keyword. Exiting.")
-        return
-
-    try:
-        pages = int(input("Number of pages to scrape (default 2): ").strip() or "2")
-    except ValueError:
-        pages = 2
     headless_answer = input("Run headless? (y/N) [recommended N while debugging]: ").strip().lower() or "n"
     headless = headless_answer == "y"
 
-    print("\nStarting scraper. A Chrome window will open. If site shows CAPTCHA or login, please solve it in the browser.")
-    items = scrape_keyword_on_site_auto_resume(keyword, cfg, pages=pages, headless=headless, manual_timeout=300)
-
-    safe_kw = keyword.replace(" ", "_")
-    csv_name = f"{cfg['id']}_{safe_kw}.csv"
-    save_to_csv(items, csv_name)
-    if PANDAS_AVAILABLE:
-        save_to_excel(items, csv_name.replace(".csv", ".xlsx"))
+    print("\nStarting scraper. If the site blocks plain requests a Chrome window will open; solve any CAPTCHA or login there.")
+    print("The same browser session is reused for every keyword until you quit.")
+    get_driver, quit_driver = lazy_driver(headless=headless)
+    pool = ProcessPoolExecutor(max_workers=PARSE_WORKERS)
+    try:
+        while True:
+            print("\nExample keywords: mobile, shoes, laptop, saree, watch, headphones, bags")
+            keyword = input("Enter keyword (blank to quit): ").strip()
+            if not keyword:
+                print("No keyword. Exiting.")
+                return
 
-    if items:
-        print(f"\nDone — saved {len(items)} records to {csv_name}")
-    else:
-        print(f"\nNo items scraped. Saved {csv_name} (headers only). Check debug files if created.")
+            try:
+                pages = int(input("Number of pages to scrape (default 2): ").strip() or "2")
+            except ValueError:
+                pages = 2
+
+            safe_kw = keyword.replace(" ", "_")
+            csv_name = f"{cfg['id']}_{safe_kw}.csv"
+            with ItemWriter(csv_name, csv_name.replace(".csv", ".jsonl")) as writer:
+                count = scrape_keyword(keyword, cfg, pages, get_driver, writer, manual_timeout=300, pool=pool)
+            if OPENPYXL_AVAILABLE:
+                save_to_excel(csv_name, csv_name.replace(".csv", ".xlsx"))
+
+            if count:
+                print(f"\nDone — saved {count} records to {csv_name}")
+            else:
+                print(f"\nNo items scraped. Saved {csv_name} (headers only). Check debug files if created.")
+    finally:
+        pool.shutdown()
+        quit_driver()
 
 if __name__ == "__main__":
     main()